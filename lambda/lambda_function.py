@@ -1,9 +1,16 @@
 import os
+import io
 import logging
 import json
+import random
+import re
+import cProfile
+import pstats
 import boto3
 import time
+import threading
 import pytz
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Key, Attr  # Import conditions module
 from ask_sdk_core.skill_builder import SkillBuilder
@@ -11,10 +18,12 @@ from ask_sdk_core.dispatch_components import AbstractRequestHandler
 from ask_sdk_core.dispatch_components import AbstractExceptionHandler
 from ask_sdk_core.handler_input import HandlerInput
 from ask_sdk_core.utils import is_request_type, is_intent_name
-from ask_sdk_model import Response
+from ask_sdk_model import Response, IntentRequest, RequestEnvelope
 from ask_sdk_model.ui import AskForPermissionsConsentCard
 from ask_sdk_model.services import ServiceException
 from ask_sdk_core.skill_builder import CustomSkillBuilder
+from ask_sdk_core.skill import CustomSkill
+from ask_sdk_runtime.dispatch_components import GenericRequestMapper
 from ask_sdk_core.api_client import DefaultApiClient
 from ask_sdk_model.services.ups import UpsServiceClient
 from datetime import datetime, timedelta, timezone
@@ -23,9 +32,39 @@ from ask_sdk_core.exceptions import AskSdkException
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# On-demand profiling: an event with 'profile': true is always profiled, Alexa requests are sampled
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', '0'))
+PROFILE_TOP_N = int(os.environ.get('PROFILE_TOP_N', '25'))
+
+# (service.operation, seconds) for each AWS call made while a profiled invocation runs, None otherwise
+profiled_aws_calls = None
+
+def record_aws_call_start(context, **kwargs):
+    # Pin the call to the profile active when it started; io_executor work can outlive the invocation
+    calls = profiled_aws_calls
+    if calls is not None:
+        context['profile_calls'] = calls
+        context['profile_start_time'] = time.perf_counter()
+
+def record_aws_call_end(model, context, **kwargs):
+    calls = context.get('profile_calls')
+    if calls is not None:
+        calls.append((f"{model.service_model.service_name}.{model.name}", time.perf_counter() - context['profile_start_time']))
+
+def register_aws_call_timing(session):
+    # Clients copy their session's event hooks when created, so register before creating any
+    session.events.register('before-call', record_aws_call_start)
+    session.events.register('after-call', record_aws_call_end)
+    return session
+
+boto3.setup_default_session()
+register_aws_call_timing(boto3.DEFAULT_SESSION)
+
 dynamodb = boto3.resource('dynamodb')
 ses = boto3.client('ses')
 table_name = 'JotJotLogs'
+# Per-user inverted index over log utterances: partition key user_term ("<user_id>#<term>"), sort key timestamp
+terms_table_name = 'JotJotLogTerms'
 
 # Get the skill name from an environment variable, with a default fallback
 SKILL_NAME = os.environ.get('SKILL_NAME', 'Daily Log')
@@ -33,6 +72,31 @@ SKILL_NAME = os.environ.get('SKILL_NAME', 'Daily Log')
 # Add these environment variables
 SENDER_EMAIL = os.environ.get('SENDER_EMAIL', 'your_verified_email@example.com')
 
+# Shared pool for independent I/O inside intent handlers, and how long a request may wait on it
+io_executor = ThreadPoolExecutor(max_workers=int(os.environ.get('IO_THREAD_POOL_SIZE', '4')))
+REQUEST_DEADLINE_SECONDS = float(os.environ.get('REQUEST_DEADLINE_SECONDS', '3'))
+
+# boto3 resources are not thread-safe, so pool threads each get their own session
+thread_local = threading.local()
+
+def get_thread_dynamodb():
+    if not hasattr(thread_local, 'dynamodb'):
+        thread_local.dynamodb = register_aws_call_timing(boto3.session.Session()).resource('dynamodb')
+    return thread_local.dynamodb
+
+def wait_for_background_task(future, deadline, description):
+    # Non-critical work: never let it hold up the response past the request deadline
+    try:
+        return future.result(timeout=max(0, deadline - time.time()))
+    except FuturesTimeoutError:
+        if future.cancel():
+            logger.warning(f"{description}: cancelled, did not start before the request deadline")
+        else:
+            logger.warning(f"{description}: still running at the request deadline, responding without it")
+    except Exception as e:
+        logger.error(f"{description}: failed: {str(e)}")
+    return None
+
 def emit_maintenance_metrics(dynamodb_table_names, lambda_function_names):
     metrics = {}
     logger.info("Starting maintenance metrics collection")
@@ -206,6 +270,102 @@ def get_user_timezone(context_object):
     # TODO: add an actual user level method to find the timezone using some context_object like handler_input or user_id (TBD)
     return 'America/Los_Angeles'  # Default to PST if there's an error
 
+STOP_WORDS = {
+    'a', 'an', 'the', 'and', 'or', 'of', 'to', 'in', 'on', 'at', 'for', 'with', 'my', 'i', 'im', 'am',
+    'is', 'are', 'was', 'it', 'that', 'this', 'now', 'just', 'some', 'me', 'did', 'do', 'last', 'take', 'took', 'taking'
+}
+
+def tokenize_utterance(utterance):
+    # Lowercase, drop apostrophes ("I'm" -> "im"), split on anything else that isn't a letter or digit
+    words = re.findall(r'[a-z0-9]+', (utterance or '').lower().replace("'", ''))
+    terms = []
+    for word in words:
+        if word not in STOP_WORDS and word not in terms:
+            terms.append(word)
+    return terms
+
+def index_log_entry(user_id, timestamp, utterance):
+    # Runs on an io_executor thread, one batched write for all of the utterance's terms
+    terms = tokenize_utterance(utterance)
+    if not terms:
+        return 0
+    table = get_thread_dynamodb().Table(terms_table_name)
+    with table.batch_writer() as batch:
+        for term in terms:
+            batch.put_item(Item={
+                'user_term': f"{user_id}#{term}",
+                'timestamp': timestamp,
+                'utterance': utterance
+            })
+    return len(terms)
+
+def log_term_key_condition(user_id, term, start=None, end=None):
+    key_condition = Key('user_term').eq(f"{user_id}#{term}")
+    if start and end:
+        key_condition = key_condition & Key('timestamp').between(start, end)
+    elif start:
+        key_condition = key_condition & Key('timestamp').gte(start)
+    elif end:
+        key_condition = key_condition & Key('timestamp').lte(end)
+    return key_condition
+
+def count_log_term_postings(user_id, term, start=None, end=None):
+    # DynamoDB counts the key range, no postings are returned
+    table = dynamodb.Table(terms_table_name)
+    query_params = {'KeyConditionExpression': log_term_key_condition(user_id, term, start, end), 'Select': 'COUNT'}
+    count = 0
+    while True:
+        response = table.query(**query_params)
+        count += response['Count']
+        if 'LastEvaluatedKey' not in response:
+            return count
+        query_params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+def order_terms_by_rarity(user_id, terms, start=None, end=None):
+    # Returns the terms rarest first, or an empty list if any term has no postings in the range
+    term_counts = {term: count_log_term_postings(user_id, term, start, end) for term in terms}
+    if not all(term_counts.values()):
+        return []
+    return sorted(terms, key=lambda term: term_counts[term])
+
+def query_log_term_postings(user_id, terms, newest_first=True, start=None, end=None):
+    # Postings of the first term, keeping only entries that contain every term.
+    # Multi-term lookups pass the rarest term first, since this is linear in its postings.
+    table = dynamodb.Table(terms_table_name)
+    query_params = {
+        'KeyConditionExpression': log_term_key_condition(user_id, terms[0], start, end),
+        'ScanIndexForward': not newest_first
+    }
+    while True:
+        response = table.query(**query_params)
+        for item in response['Items']:
+            if len(terms) == 1 or set(terms).issubset(tokenize_utterance(item['utterance'])):
+                yield item
+        if 'LastEvaluatedKey' not in response:
+            break
+        query_params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+def find_latest_log_entry(user_id, query, start=None, end=None):
+    terms = tokenize_utterance(query)
+    if len(terms) > 1:
+        terms = order_terms_by_rarity(user_id, terms, start, end)
+    if not terms:
+        return None
+    return next(query_log_term_postings(user_id, terms, start=start, end=end), None)
+
+def count_log_entries(user_id, query, start=None, end=None):
+    terms = tokenize_utterance(query)
+    if not terms:
+        return 0
+    if len(terms) == 1:
+        return count_log_term_postings(user_id, terms[0], start, end)
+
+    # Multi-term: one COUNT query per term, then only the rarest term's postings are read
+    terms = order_terms_by_rarity(user_id, terms, start, end)
+    if not terms:
+        return 0
+    return sum(1 for item in query_log_term_postings(user_id, terms, start=start, end=end))
+
 class LaunchRequestHandler(AbstractRequestHandler):
     def can_handle(self, handler_input):
         return is_request_type("LaunchRequest")(handler_input)
@@ -256,6 +416,14 @@ class LogActivityIntentHandler(AbstractRequestHandler):
         now = datetime.now(tz)
         timestamp = now.isoformat()
         
+        deadline = time.time() + REQUEST_DEADLINE_SECONDS
+        # update email permissions for this user in the background while the log entry is written;
+        # if it fails, logging will catch and fix it later. It does not depend on the log entry,
+        # so it runs even when the put_item below fails.
+        # TODO: is this a good place to remind the user to enable their email permissions?
+        permissions_future = io_executor.submit(self.update_email_permissions, handler_input)
+        index_future = None
+
         try:
             table = dynamodb.Table(table_name)
             item = {
@@ -268,18 +436,17 @@ class LogActivityIntentHandler(AbstractRequestHandler):
             response = table.put_item(Item=item)            
             speak_output = f"Got it!"
 
-            try:
-                # update email permissions for this user given the handler_input
-                self.update_email_permissions(handler_input)
-            except Exception as e:
-                logger.error(f"LogActivityIntentHandler: Error updating email permissions: {str(e)}")
-                # keep going even if email permission update fails, logging will catch and fix it later
-                # TODO: is this a good place to remind the user to enable their email permissions?
+            # index only entries that made it into the log; still overlaps with the permission refresh
+            index_future = io_executor.submit(index_log_entry, user_id, timestamp, full_utterance)
   
         except ClientError as e:
             logger.error(f"Error logging to DynamoDB: {e.response['Error']['Message']}")
             speak_output = f"Sorry, there was an error logging your activity. Please try again."
 
+        wait_for_background_task(permissions_future, deadline, "LogActivityIntentHandler: email permission update")
+        if index_future:
+            wait_for_background_task(index_future, deadline, "LogActivityIntentHandler: search index update")
+
         return (
             handler_input.response_builder
                 .speak(speak_output)
@@ -298,9 +465,14 @@ class LogActivityIntentHandler(AbstractRequestHandler):
         # Get user ID
         user_id = handler_input.request_envelope.context.system.user.user_id
 
-        # Initialize DynamoDB client
-        dynamodb = boto3.resource('dynamodb')
-        table = dynamodb.Table('jotjot_UserEmailPreferences')  # Move to an Env var
+        # Initialize DynamoDB client (this may run on an io_executor thread)
+        table = get_thread_dynamodb().Table('jotjot_UserEmailPreferences')  # Move to an Env var
+
+        # Get current time in user's timezone
+        user_timezone = get_user_timezone(handler_input)
+        tz = pytz.timezone(user_timezone)
+        now = datetime.now(tz)
+        timestamp = now.isoformat()
 
         try:
             # Attempt to get the user's email
@@ -308,12 +480,6 @@ class LogActivityIntentHandler(AbstractRequestHandler):
             ups_service = service_client_factory.get_ups_service()
             email = ups_service.get_profile_email()
 
-            # Get current time in user's timezone
-            user_timezone = get_user_timezone(handler_input)
-            tz = pytz.timezone(user_timezone)
-            now = datetime.now(tz)
-            timestamp = now.isoformat()
-            
             update_expression = 'SET email_summary_enabled = :val, email = :email, last_updated_email_permissions = :timestamp'
             expression_values = {':val': True, ':email': email, ':timestamp': timestamp}
             
@@ -346,6 +512,41 @@ class LogActivityIntentHandler(AbstractRequestHandler):
         logger.info("Email permission update process completed.")
         return True
 
+class SearchLogIntentHandler(AbstractRequestHandler):
+    def can_handle(self, handler_input):
+        return is_intent_name("SearchLogIntent")(handler_input)
+
+    def handle(self, handler_input):
+        user_id = handler_input.request_envelope.session.user.user_id
+        query = handler_input.request_envelope.request.intent.slots["query"].value
+
+        if not tokenize_utterance(query):
+            speak_output = "What would you like me to look for in your log? For example, say 'when did I last take Tylenol'."
+            return (
+                handler_input.response_builder
+                    .speak(speak_output)
+                    .ask(speak_output)
+                    .set_should_end_session(False)
+                    .response
+            )
+
+        try:
+            item = find_latest_log_entry(user_id, query)
+            if item:
+                formatted_timestamp = datetime.fromisoformat(item['timestamp']).strftime('%B %d, %Y at %I:%M %p')
+                speak_output = f"The last time you logged that was {formatted_timestamp}: {item['utterance']}"
+            else:
+                speak_output = f"I couldn't find anything in your log about {query}."
+        except ClientError as e:
+            logger.error(f"Error searching log terms: {e.response['Error']['Message']}")
+            speak_output = "Sorry, there was an error searching your log. Please try again."
+
+        return (
+            handler_input.response_builder
+                .speak(speak_output)
+                .response
+        )
+
 class HelpIntentHandler(AbstractRequestHandler):
     def can_handle(self, handler_input):
         return is_intent_name("AMAZON.HelpIntent")(handler_input)
@@ -405,7 +606,7 @@ class DailyReportHandler:
             # Scan the email preferences table for users who have enabled email summaries
             preferences_table = dynamodb.Table('jotjot_UserEmailPreferences')
             
-            if user_id:  # If user_id is provided, fetch email preference for that user
+            if user_id is not None:  # If user_id is provided, fetch email preference for that user
                 response = preferences_table.get_item(Key={'user_id': user_id})
                 eligible_users = [response['Item']] if 'Item' in response and response['Item'].get('email_summary_enabled', False) else []
             else:  # Otherwise, fetch all users with email summaries enabled
@@ -682,11 +883,126 @@ class GrantEmailPermissionIntentHandler(AbstractRequestHandler):
                 .response
         )
 
+class RouteTableRequestMapper(GenericRequestMapper):
+    """Resolves request types and intent names to handler chains with a dict lookup.
+
+    Requests that are not in the route table fall back to the SDK's
+    in-order ``can_handle`` scan, so unrouted handlers keep working.
+    """
+    def __init__(self, request_handler_chains, routes):
+        super(RouteTableRequestMapper, self).__init__(request_handler_chains)
+        chains_by_handler_type = {type(chain.request_handler): chain for chain in self.request_handler_chains}
+        self.route_table = {route_key: chains_by_handler_type[handler_type] for route_key, handler_type in routes.items()}
+
+    def get_request_handler_chain(self, handler_input):
+        request = handler_input.request_envelope.request
+        if isinstance(request, IntentRequest):
+            route_key = request.intent.name
+        else:
+            route_key = request.object_type
+
+        request_handler_chain = self.route_table.get(route_key)
+        if request_handler_chain is None:
+            request_handler_chain = super(RouteTableRequestMapper, self).get_request_handler_chain(handler_input)
+        return request_handler_chain
+
+class EventRoute:
+    """A scheduled/test event flag routed to a plain handler function.
+
+    ``required`` and ``optional`` map payload field names to the type(s) the field must have.
+    """
+    def __init__(self, flag, handler, priority, required=None, optional=None):
+        self.flag = flag
+        self.handler = handler
+        self.priority = priority
+        self.required = required or {}
+        self.optional = optional or {}
+
+    def validate(self, event):
+        # Empty values count as missing: an empty user_id must never widen a per-user job to all users
+        for field, field_type in self.required.items():
+            if not event.get(field):
+                return f"{field} not provided"
+            if not isinstance(event[field], field_type):
+                return f"{field} has an invalid type"
+        # Optional fields may be left out, but an explicit null is rejected like any other wrong type
+        for field, field_type in self.optional.items():
+            if field in event and not isinstance(event[field], field_type):
+                return f"{field} has an invalid type"
+        return None
+
+# Maps the event flag (e.g. 'daily_report') to its EventRoute. Registration order is the
+# precedence used when an event carries more than one flag.
+EVENT_ROUTES = {}
+
+def event_route(flag, required=None, optional=None):
+    def register(handler):
+        EVENT_ROUTES[flag] = EventRoute(flag, handler, len(EVENT_ROUTES), required, optional)
+        return handler
+    return register
+
+def find_event_route(event):
+    # Alexa request envelopes never carry event flags, skip straight to the skill
+    if 'request' in event:
+        return None
+    matched_routes = [EVENT_ROUTES[flag] for flag in event.keys() & EVENT_ROUTES.keys() if event[flag]]
+    if not matched_routes:
+        return None
+    return min(matched_routes, key=lambda route: route.priority)
+
+@event_route('daily_report', optional={'dry_run': bool})
+def handle_daily_report_event(event):
+    dry_run_flag = event.get('dry_run', False)
+    if dry_run_flag:
+        logger.info('Dry run flag enabled for daily report event')
+    DailyReportHandler.send_daily_report(dry_run=dry_run_flag)
+    logger.info('Daily report event handled.', extra={'event': event})
+    return {'statusCode': 200, 'body': 'Daily report process completed'}
+
+@event_route('email_summary_flag', required={'user_id': str})
+def handle_email_summary_flag_event(event):
+    email_summary_enabled = get_user_email_preference(event['user_id'])
+    logger.info(f"Email summary enabled flag: {email_summary_enabled}")
+    return {'statusCode': 200, 'body': f'Email summary enabled: {email_summary_enabled}'}
+
+@event_route('daily_maintenance', optional={'dynamodb_table_names': list, 'lambda_function_names': list})
+def handle_daily_maintenance_event(event):
+    dynamodb_table_names = event.get('dynamodb_table_names', ['jotjot_UserEmailPreferences', 'JotJotLogs', terms_table_name])
+    lambda_function_names = event.get('lambda_function_names', ['JotJotFunction'])
+    logger.info('dynamodb_table_names: ' + str(dynamodb_table_names) + ' lambda_function_names: ' + str(lambda_function_names))
+    emit_maintenance_metrics(dynamodb_table_names, lambda_function_names)
+    logger.info('Daily maintenance task event handled.', extra={'event': event})
+    return {'statusCode': 200, 'body': 'Daily maintenance task process completed.'}
+
+@event_route('test_user_id_email_report', required={'user_id': str})
+def handle_test_user_id_email_report_event(event):
+    user_id = event['user_id']
+    logger.info(f"test_user_id_email_report: Sending daily report for user_id: {user_id}")
+    DailyReportHandler.send_daily_report(user_id=user_id)
+    return {'statusCode': 200, 'body': f'Daily report sent for user_id: {user_id}'}
+
+@event_route('search_log_terms', required={'user_id': str, 'query': str}, optional={'start': str, 'end': str})
+def handle_search_log_terms_event(event):
+    user_id = event['user_id']
+    query = event['query']
+    start = event.get('start')
+    end = event.get('end')
+    latest_item = find_latest_log_entry(user_id, query, start=start, end=end)
+    result = {
+        'query': query,
+        'terms': tokenize_utterance(query),
+        'latest': {'timestamp': latest_item['timestamp'], 'utterance': latest_item['utterance']} if latest_item else None,
+        'count': count_log_entries(user_id, query, start=start, end=end)
+    }
+    logger.info(f"search_log_terms: {json.dumps(result)}")
+    return {'statusCode': 200, 'body': json.dumps(result)}
+
 sb = CustomSkillBuilder(api_client=DefaultApiClient())
 # sb = SkillBuilder()
 
 sb.add_request_handler(LaunchRequestHandler())
 sb.add_request_handler(LogActivityIntentHandler())
+sb.add_request_handler(SearchLogIntentHandler())
 sb.add_request_handler(HelpIntentHandler())
 sb.add_request_handler(CancelOrStopIntentHandler())
 sb.add_request_handler(SessionEndedRequestHandler())
@@ -694,40 +1010,79 @@ sb.add_request_handler(GrantEmailPermissionIntentHandler())
 sb.add_request_handler(StopReportsIntentHandler())
 sb.add_exception_handler(CatchAllExceptionHandler())
 
+# Request type / intent name -> handler class. Anything missing here is routed by can_handle.
+REQUEST_ROUTES = {
+    'LaunchRequest': LaunchRequestHandler,
+    'SessionEndedRequest': SessionEndedRequestHandler,
+    'LogActivityIntent': LogActivityIntentHandler,
+    'SearchLogIntent': SearchLogIntentHandler,
+    'AMAZON.HelpIntent': HelpIntentHandler,
+    'AMAZON.CancelIntent': CancelOrStopIntentHandler,
+    'AMAZON.StopIntent': CancelOrStopIntentHandler,
+    'GrantEmailPermissionIntent': GrantEmailPermissionIntentHandler,
+    'StopReportsIntent': StopReportsIntentHandler,
+}
+
+def build_skill():
+    skill_config = sb.skill_configuration
+    request_handler_chains = skill_config.request_mappers[0].request_handler_chains
+    skill_config.request_mappers = [RouteTableRequestMapper(request_handler_chains, REQUEST_ROUTES)]
+    return CustomSkill(skill_configuration=skill_config)
+
+# Built once per container rather than on every invocation
+skill = build_skill()
+
+def should_profile(event):
+    if event.get('profile'):
+        return True
+    return 'request' in event and PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+def run_profiled(handler, event, context):
+    # cProfile only sees the calling thread; io_executor work shows up in the AWS call breakdown
+    global profiled_aws_calls
+    profiled_aws_calls = []
+    profiler = cProfile.Profile()
+    start_time = time.perf_counter()
+    try:
+        return profiler.runcall(handler, event, context)
+    finally:
+        elapsed = time.perf_counter() - start_time
+        aws_calls, profiled_aws_calls = profiled_aws_calls, None
+
+        stats_output = io.StringIO()
+        pstats.Stats(profiler, stream=stats_output).sort_stats('cumulative').print_stats(PROFILE_TOP_N)
+        logger.info(f"Profile: invocation took {elapsed:.3f} seconds, top {PROFILE_TOP_N} functions by cumulative time:\n{stats_output.getvalue()}")
+
+        aws_call_totals = {}
+        for operation, seconds in aws_calls:
+            count, total = aws_call_totals.get(operation, (0, 0.0))
+            aws_call_totals[operation] = (count + 1, total + seconds)
+        aws_total = sum(total for count, total in aws_call_totals.values())
+        logger.info(f"Profile: {len(aws_calls)} AWS calls took {aws_total:.3f} seconds")
+        for operation, (count, total) in sorted(aws_call_totals.items(), key=lambda entry: entry[1][1], reverse=True):
+            logger.info(f"Profile: AWS {operation}: {count} calls, {total:.3f} seconds")
+
 def lambda_handler(event, context):
+    if should_profile(event):
+        return run_profiled(dispatch_event, event, context)
+    return dispatch_event(event, context)
+
+def dispatch_event(event, context):
     # logger.info out the intent name for debugging
     if 'request' in event and 'intent' in event['request']:
         logger.info(f"Intent name: {event['request']['intent']['name']}")
 
-    if event.get('daily_report'):
-        dry_run_flag = event.get('dry_run', False)
-        if dry_run_flag:
-            logger.info('Dry run flag enabled for daily report event')
-        DailyReportHandler.send_daily_report(dry_run=dry_run_flag)
-        logger.info('Daily report event handled.', extra={'event': event})
-        return {'statusCode': 200, 'body': 'Daily report process completed'}
-    elif event.get('email_summary_flag'):
-        email_summary_enabled = get_user_email_preference(event['user_id'])
-        logger.info(f"Email summary enabled flag: {email_summary_enabled}")
-        return {'statusCode': 200, 'body': f'Email summary enabled: {email_summary_enabled}'}
-    elif event.get('daily_maintenance'):
-        # TODO: fetch these next two constants from the event which will be supplied in eventbridge schedule payload
-        dynamodb_table_names = event.get('dynamodb_table_names', ['jotjot_UserEmailPreferences', 'JotJotLogs'])
-        lambda_function_names = event.get('lambda_function_names', ['JotJotFunction'])
-        logger.info('dynamodb_table_names: ' + str(dynamodb_table_names) + ' lambda_function_names: ' + str(lambda_function_names))
-        emit_maintenance_metrics(dynamodb_table_names, lambda_function_names)
-        logger.info('Daily maintenance task event handled.', extra={'event': event})
-        return {'statusCode': 200, 'body': 'Daily maintenance task process completed.'}
-    elif event.get('test_user_id_email_report'):
-        user_id = event.get('user_id')
-        if user_id:
-            logger.info(f"test_user_id_email_report: Sending daily report for user_id: {user_id}")
-            DailyReportHandler.send_daily_report(user_id=user_id)
-            return {'statusCode': 200, 'body': f'Daily report sent for user_id: {user_id}'}
-        else:
-            logger.error('test_user_id_email_report: user_id not provided in the event')
-            return {'statusCode': 400, 'body': 'user_id not provided'}
-    else:
-        logger.info('Normal skill invocation.')
+    route = find_event_route(event)
+    if route:
+        validation_error = route.validate(event)
+        if validation_error:
+            logger.error(f"{route.flag}: {validation_error} in the event")
+            return {'statusCode': 400, 'body': validation_error}
+        return route.handler(event)
+
+    logger.info('Normal skill invocation.')
 
-    return sb.lambda_handler()(event, context) # Call the SkillBuilder instance to route the request
\ No newline at end of file
+    # Route the request through the prebuilt skill instance
+    request_envelope = skill.serializer.deserialize(payload=json.dumps(event), obj_type=RequestEnvelope)
+    response_envelope = skill.invoke(request_envelope=request_envelope, context=context)
+    return skill.serializer.serialize(response_envelope)